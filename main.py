@@ -1,33 +1,35 @@
+import flask
 import functions_framework
+import importlib.util
 import os
-import base64
+import binascii
 import io
-from datetime import datetime
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
 
 # Using PDFMiner for extracting field positions (optional but helpful for debugging)
-try:
-    from pdfminer.high_level import extract_text
-    from pdfminer.layout import LAParams
-    PDFMINER_AVAILABLE = True
-except ImportError:
-    PDFMINER_AVAILABLE = False
+# Only check that it is installed; importing it on every cold start is wasted work
+PDFMINER_AVAILABLE = importlib.util.find_spec("pdfminer") is not None
 
-# Using fillpdf for filling the PDF form
-from fillpdf import fillpdfs
+# Using pypdf for filling the PDF form and drawing the signature overlay
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject, NumberObject
 
-# Using PyPDF2 and reportlab for creating and merging overlays
-from PyPDF2 import PdfReader, PdfWriter
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.utils import ImageReader
-from reportlab.lib.colors import black, white
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+# Using PIL for decoding and preparing the signature image
 from PIL import Image
 
 # --- Configuration ---
 TEMPLATE_PDF_PATH = os.path.join(os.path.dirname(__file__), "Nexli App fillable - working.pdf")  # Using the fillable version
 OUTPUT_PDF_FILENAME = "filled_form.pdf"
+# --- Batch requests ---
+BATCH_OUTPUT_FILENAME = "filled_forms.zip"
+BATCH_MAX_WORKERS = 4
+BATCH_MAX_ITEMS = 20  # Each filled PDF is ~800KB, keep a batch well inside the function's memory
+# --- Signature data-URL prefix ---
+SIGNATURE_PREFIX = "data:image/png;base64,"
+SIGNATURE_PREFIX_LEN = len(SIGNATURE_PREFIX)
 # --- Signature positioning ---
 SIGNATURE_X = 350  # Centered position
 SIGNATURE_Y = 250  # Higher on the page
@@ -45,19 +47,40 @@ SIGNATURE_POSITION = {
     "width": 350,  # Width adjusted to better fit the signature line
     "page": 0     # Page index (0-based)
 }
+SIGNATURE_OVERSAMPLE = 3  # Pixels per point kept when downscaling the signature (~216 dpi)
+
+# Template cache shared across warm invocations, keyed by path and invalidated by mtime
+_TEMPLATE_CACHE = {}
+# pypdf readers load objects lazily from their stream, so cloning the shared reader is serialised
+_TEMPLATE_LOCK = threading.Lock()
+
+def get_template(path):
+    """Return (bytes, fields, PdfReader) for the template, re-reading it only if it changed on disk"""
+    mtime = os.stat(path).st_mtime
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    with open(path, "rb") as f:
+        template_bytes = f.read()
+    reader = PdfReader(io.BytesIO(template_bytes))
+    fields = reader.get_fields() or {}
+    
+    _TEMPLATE_CACHE[path] = (mtime, (template_bytes, fields, reader))
+    return template_bytes, fields, reader
 
-# Check if PDF is fillable on startup - this will log the field names
+# Check if PDF is fillable on startup - this will log the field names and warm the cache
 try:
     if os.path.exists(TEMPLATE_PDF_PATH):
-        fields = fillpdfs.get_form_fields(TEMPLATE_PDF_PATH)
-        print(f"PDF form fields found in template: {fields}")
+        _, fields, _ = get_template(TEMPLATE_PDF_PATH)
+        print(f"PDF form fields found in template: {list(fields)}")
     else:
         print(f"Warning: Template PDF '{TEMPLATE_PDF_PATH}' not found.")
 except Exception as e:
     print(f"Warning: Error checking PDF form fields: {e}")
 
 # Special fields that require custom handling
-CHECKBOX_FIELDS = [
+CHECKBOX_FIELDS = frozenset({
     "bankAccountOpen90Days",
     "isBusinessForSale", 
     "filedBankruptcy", 
@@ -65,7 +88,7 @@ CHECKBOX_FIELDS = [
     "isUSCitizenPermanentResident",
     "ownOrRent",
     "agreeToTerms"
-]
+})
 
 # Field mapping from input fields to PDF form fields1
 FIELD_MAPPING = {
@@ -122,31 +145,72 @@ FIELD_MAPPING = {
     "agreeToTerms": ["Checkbox_13", "Checkbox_14"]         # Yes/No pair
 }
 
-# Method to add signature to the PDF
-def add_signature_to_pdf(input_pdf_path, output_pdf_path, signature_image_path, signature_hash=None, signature_date=None):
-    """Add signature image to PDF as an overlay"""
+# Split the mapping once at import time so the request loops don't have to branch on field type
+TEXT_FIELDS = {name: pdf_name for name, pdf_name in FIELD_MAPPING.items() if name not in CHECKBOX_FIELDS}
+CHECKBOX_PAIRS = {name: tuple(FIELD_MAPPING[name]) for name in CHECKBOX_FIELDS}
+
+# Checkbox input values (lowercased) that mean "yes"
+CHECKBOX_TRUE_VALUES = frozenset({"yes", "y", "true", "t", "1", "on", "own"})
+
+# Maximum characters per text field to avoid overflow
+DEFAULT_MAX_LENGTH = 40  # Maximum characters for most fields
+FIELD_MAX_LENGTH = {
+    "businessEmail": 30,  # Email tends to be long
+    "businessType": 35,   # Business type can be long
+}
+
+# Method to fill the template's form fields in-process
+def fill_form_fields(template_reader, fields, pdf_form_data):
+    """Fill the form fields of the template and return the resulting PdfWriter"""
+    
+    with _TEMPLATE_LOCK:
+        writer = PdfWriter(clone_from=template_reader)
     
-    # Load the input PDF
-    template_pdf = PdfReader(input_pdf_path)
-    output_pdf = PdfWriter()
+    values = {}
+    for pdf_field_name, value in pdf_form_data.items():
+        # Drop fields the template doesn't have, pypdf would compare them against every widget
+        field = fields.get(pdf_field_name)
+        if field is None:
+            continue
+        
+        value = str(value)
+        # pypdf only checks a checkbox when given its own "on" state, so map "Yes" onto it
+        if value == "Yes" and field.get("/FT") == "/Btn":
+            on_states = [state for state in field.get("/_States_", []) if state != "/Off"]
+            if on_states:
+                value = on_states[0]
+        values[pdf_field_name] = value
     
-    # Create overlay with signature
-    packet = io.BytesIO()
-    can = canvas.Canvas(packet, pagesize=letter)
+    for page in writer.pages:
+        if "/Annots" in page:
+            writer.update_page_form_field_values(page, values)
     
-    # Load and process the signature image
-    signature_image = Image.open(signature_image_path)
+    return writer
+
+# Method to turn a PIL image into a PDF image XObject
+def _image_xobject(image, color_space):
+    """Return a Flate-compressed image XObject stream holding the image's raw 8-bit samples"""
+    stream = DecodedStreamObject()
+    stream.set_data(image.tobytes())
+    stream = stream.flate_encode()
+    stream.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(image.width),
+        NameObject("/Height"): NumberObject(image.height),
+        NameObject("/ColorSpace"): NameObject(color_space),
+        NameObject("/BitsPerComponent"): NumberObject(8),
+    })
+    return stream
+
+# Method to add signature to the PDF
+def add_signature_to_pdf(filled_pdf, signature_image, signature_hash=None, signature_date=None):
+    """Add signature image to PDF as an overlay and return the resulting PDF as a BytesIO"""
     
     # Ensure we preserve transparency
     if signature_image.mode != 'RGBA':
         signature_image = signature_image.convert('RGBA')
     
-    # Create a white background layer
-    background = Image.new('RGBA', signature_image.size, (255, 255, 255, 0))
-    
-    # Composite the image onto the transparent background
-    signature_image = Image.alpha_composite(background, signature_image)
-    
     # Calculate aspect ratio
     img_width, img_height = signature_image.size
     aspect = img_height / float(img_width)
@@ -157,44 +221,154 @@ def add_signature_to_pdf(input_pdf_path, output_pdf_path, signature_image_path,
     width = SIGNATURE_POSITION["width"]
     height = width * aspect * 0.25  # Made signature height even smaller (25% of proportional height)
     
-    # Add the signature to the canvas
-    sig_image_reader = ImageReader(signature_image)
-    can.drawImage(sig_image_reader, x, y, width=width, height=height, mask='auto')
+    # Downscale large signature pad images so we don't embed far more pixels than are drawn
+    target_width = int(width * SIGNATURE_OVERSAMPLE)
+    if img_width > target_width:
+        signature_image = signature_image.resize((target_width, max(1, round(target_width * aspect))), Image.LANCZOS)
     
-    # Save the canvas
-    can.save()
-    packet.seek(0)
-    
-    # Create overlay PDF
-    overlay_pdf = PdfReader(packet)
-    
-    # Apply overlay to the first page (or specified page)
+    # Apply overlay to the first page (or specified page) of the filled PDF in place;
+    # other pages are left untouched, and an invalid page index adds no signature
     page_idx = SIGNATURE_POSITION["page"]
-    if 0 <= page_idx < len(template_pdf.pages):
-        page = template_pdf.pages[page_idx]
-        page.merge_page(overlay_pdf.pages[0])
-        output_pdf.add_page(page)
+    if 0 <= page_idx < len(filled_pdf.pages):
+        page = filled_pdf.pages[page_idx]
+        
+        # Build the signature as an image XObject, with the alpha channel as its soft mask;
+        # streams have to be indirect objects, so they are added to the writer directly
+        sig_xobject = _image_xobject(signature_image.convert('RGB'), "/DeviceRGB")
+        sig_xobject[NameObject("/SMask")] = filled_pdf._add_object(
+            _image_xobject(signature_image.getchannel('A'), "/DeviceGray")
+        )
         
-        # Add all other pages unchanged
-        for i in range(len(template_pdf.pages)):
-            if i != page_idx:
-                output_pdf.add_page(template_pdf.pages[i])
+        # Draw it on a blank overlay page and merge that onto the target page
+        overlay_page = PageObject.create_blank_page(width=page.mediabox.width, height=page.mediabox.height)
+        overlay_page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/XObject"): DictionaryObject({NameObject("/Signature"): filled_pdf._add_object(sig_xobject)})
+        })
+        overlay_content = DecodedStreamObject()
+        overlay_content.set_data(f"q {width:.4f} 0 0 {height:.4f} {x:.4f} {y:.4f} cm /Signature Do Q".encode('ascii'))
+        overlay_page[NameObject("/Contents")] = overlay_content
+        page.merge_page(overlay_page)
+    
+    # Write output PDF to memory
+    output_buf = io.BytesIO()
+    filled_pdf.write(output_buf)
+    output_buf.seek(0)
+    
+    return output_buf
+
+# Method to set a Yes/No checkbox pair
+def _set_checkbox_pair(pdf_form_data, field_pair, is_yes):
+    """Check one box of the pair and clear the other"""
+    yes_field, no_field = field_pair
+    pdf_form_data[yes_field] = "Yes" if is_yes else "Off"
+    pdf_form_data[no_field] = "Off" if is_yes else "Yes"
+
+# Method to validate a request item before any PDF work is done
+def _validate_item(data):
+    """Return an error response for a malformed request item, or None if it is valid"""
+    if not isinstance(data, dict):
+        return "Invalid input format: Expected each item to be an object.", 400
+    if 'body' not in data:
+        return "Invalid input format: Missing 'body' key.", 400
+    
+    form_fields = data['body']
+    if not isinstance(form_fields, dict):
+        return "Invalid input format: Expected 'body' to be an object.", 400
+    
+    # Validate signature
+    signature_base64 = form_fields.get("signatureImageBase64", "")
+    if not isinstance(signature_base64, str) or not signature_base64.startswith(SIGNATURE_PREFIX):
+        return "Invalid signature format: Expected 'data:image/png;base64,...'", 400
+    
+    return None
+
+# Method to fill the template for a single request item
+def _process_one(form_fields, available_fields, template_reader):
+    """Fill the template with one item's form data and signature.
+    Returns:
+        A (BytesIO, None) tuple with the final PDF, or (None, error response)
+        if the item could not be processed.
+    """
+    # Extract data
+    signature_base64 = form_fields.get("signatureImageBase64", "")
+    signature_hash = form_fields.get("signatureDataHash", "N/A")
+    # Only fall back to today's date when none was sent, rather than formatting it on every request
+    if "signatureDate" in form_fields:
+        signature_date = form_fields["signatureDate"]
     else:
-        # If page index is invalid, just add all pages unchanged
-        for i in range(len(template_pdf.pages)):
-            output_pdf.add_page(template_pdf.pages[i])
+        signature_date = date.today().isoformat()
     
-    # Write output PDF
-    with open(output_pdf_path, "wb") as output_stream:
-        output_pdf.write(output_stream)
+    # Decode signature image in memory
+    try:
+        # Skip the data-URL prefix with a zero-copy view instead of splitting the string
+        signature_base64_data = memoryview(signature_base64.encode('ascii'))[SIGNATURE_PREFIX_LEN:]
+        signature_bytes = binascii.a2b_base64(signature_base64_data)
+        signature_image = Image.open(io.BytesIO(signature_bytes))
+        signature_image.load()
+    except Exception as e:
+        return None, (f"Error processing signature: {e}", 500)
     
-    return True
+    # Prepare form data to fill the PDF
+    pdf_form_data = {}
+    
+    # Process text fields
+    for field_name, pdf_field_name in TEXT_FIELDS.items():
+        value = form_fields.get(field_name)
+        if value is None:
+            continue
+        
+        # Truncate very long text values to avoid overflow
+        pdf_form_data[pdf_field_name] = str(value)[:FIELD_MAX_LENGTH.get(field_name, DEFAULT_MAX_LENGTH)]
+    
+    # Process checkboxes
+    for checkbox_field, field_pair in CHECKBOX_PAIRS.items():
+        if checkbox_field in form_fields:
+            value = form_fields[checkbox_field]
+            # Convert value to boolean
+            is_yes = value is True or str(value).strip().lower() in CHECKBOX_TRUE_VALUES
+            _set_checkbox_pair(pdf_form_data, field_pair, is_yes)
+    
+    # Add the signature date to the form
+    if "signatureDate" in TEXT_FIELDS:
+        pdf_form_data[TEXT_FIELDS["signatureDate"]] = signature_date
+    
+    # Add signature date and hash to Text_41 if available
+    if signature_date or signature_hash:
+        text = ""
+        if signature_date:
+            text += f"Signed: {signature_date}"
+        if signature_hash:
+            if text:
+                text += " | "
+            text += f"Hash: {signature_hash}"
+        
+        pdf_form_data['Text_41'] = text
+    
+    # Process form data
+    try:
+        # Fill the PDF form in a single pass, keeping form fields active
+        filled_pdf = fill_form_fields(template_reader, available_fields, pdf_form_data)
+        
+        # Add signature to the PDF using our custom method
+        output_buf = add_signature_to_pdf(
+            filled_pdf,
+            signature_image,
+            signature_hash,
+            signature_date
+        )
+        print("Signature added to PDF")
+    except Exception as e:
+        return None, (f"Error filling PDF form: {e}", 500)
+    
+    return output_buf, None
 
 @functions_framework.http
 def fill_pdf_form(request):
     """HTTP Cloud Function to fill a PDF template with data and signature.
     Args:
-        request (flask.Request): The request object.
+        request (flask.Request): The request object. The JSON body is a list
+            of {"body": {...}} items; a single item returns one PDF, several
+            items return a zip with one PDF per item.
     Returns:
         The response text, or any set of values that can be converted to a
         response by Flask.
@@ -204,169 +378,73 @@ def fill_pdf_form(request):
 
     request_json = request.get_json(silent=True)
 
-    # Assuming the input is a list containing one object
+    # Assuming the input is a list of one or more objects
     if not isinstance(request_json, list) or not request_json:
          return "Invalid input format: Expected a non-empty list.", 400
 
-    try:
-        # Use the first item in the list
-        data = request_json[0]
-        if 'body' not in data:
-             return "Invalid input format: Missing 'body' key.", 400
-        
-        # Extract data
-        form_fields = data.get('body', {})
-        signature_base64 = form_fields.get("signatureImageBase64", "")
-        signature_hash = form_fields.get("signatureDataHash", "N/A")
-        signature_date = form_fields.get("signatureDate", datetime.now().strftime('%Y-%m-%d'))
-        
-        # Validate signature
-        if not signature_base64.startswith('data:image/png;base64,'):
-            return "Invalid signature format: Expected 'data:image/png;base64,...'", 400
-
-        # Create temporary paths for file processing
-        temp_signature_path = "/tmp/signature.png"
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S%f')
-        temp_filled_pdf_path = f"/tmp/{OUTPUT_PDF_FILENAME.replace('.pdf', f'_temp_{timestamp}.pdf')}"
-        output_pdf_path = f"/tmp/{OUTPUT_PDF_FILENAME.replace('.pdf', f'_{timestamp}.pdf')}"
+    is_batch = len(request_json) > 1
 
-        # Check if template PDF exists
-        if not os.path.exists(TEMPLATE_PDF_PATH):
-             return f"Error: Template PDF '{TEMPLATE_PDF_PATH}' not found.", 500
+    try:
+        # Validate every item before touching the template
+        if len(request_json) > BATCH_MAX_ITEMS:
+            return f"Invalid input format: Expected at most {BATCH_MAX_ITEMS} items.", 400
+        for index, data in enumerate(request_json, start=1):
+            error = _validate_item(data)
+            if error:
+                message, status = error
+                return (f"Item {index}: {message}" if is_batch else message), status
 
-        # Verify the PDF is fillable by checking for form fields
+        # Load the template (a cache hit on warm instances) and verify it is fillable
         try:
-            available_fields = fillpdfs.get_form_fields(TEMPLATE_PDF_PATH)
+            _, available_fields, template_reader = get_template(TEMPLATE_PDF_PATH)
             if not available_fields:
                 return "Error: The template PDF does not appear to be fillable (no form fields found).", 500
-            print(f"Available PDF fields: {available_fields}")
+            print(f"Available PDF fields: {list(available_fields)}")
+        except FileNotFoundError:
+            return f"Error: Template PDF '{TEMPLATE_PDF_PATH}' not found.", 500
         except Exception as e:
             return f"Error: Could not read form fields from PDF: {e}", 500
         
-        # Save signature image
-        try:
-            signature_base64_data = signature_base64.split(',')[1]
-            signature_bytes = base64.b64decode(signature_base64_data)
-            with open(temp_signature_path, "wb") as f:
-                f.write(signature_bytes)
-        except Exception as e:
-            return f"Error processing signature: {e}", 500
-        
-        # Prepare form data to fill the PDF
-        pdf_form_data = {}
-        
-        # Process text fields
-        for field_name, value in form_fields.items():
-            # Skip signature and other special fields
-            if field_name in ["signatureImageBase64", "signatureDataHash"] or field_name in CHECKBOX_FIELDS:
-                continue
-            
-            # Map to PDF field name
-            if field_name in FIELD_MAPPING:
-                pdf_field_name = FIELD_MAPPING[field_name]
-                
-                # Truncate very long text values to avoid overflow
-                max_length = 40  # Maximum characters for most fields
-                
-                # Special handling for email which tends to be long
-                if field_name == "businessEmail" and len(str(value)) > 30:
-                    value = str(value)[:30]
-                # Special handling for business type which can be long
-                elif field_name == "businessType" and len(str(value)) > 35:
-                    value = str(value)[:35]
-                # General truncation for all other fields
-                elif isinstance(value, str) and len(value) > max_length:
-                    value = value[:max_length]
-                
-                pdf_form_data[pdf_field_name] = value
-        
-        # Process checkboxes
-        for checkbox_field in CHECKBOX_FIELDS:
-            if checkbox_field in form_fields:
-                value = form_fields[checkbox_field]
-                field_pair = FIELD_MAPPING.get(checkbox_field)
-                if field_pair:
-                    # Convert value to boolean
-                    if isinstance(value, bool):
-                        is_yes = value
-                    else:
-                        value_lower = str(value).lower()
-                        is_yes = value_lower in ["yes", "true", "1", "on", "own"]
-                    
-                    # Set Yes/No checkboxes
-                    yes_field, no_field = field_pair
-                    pdf_form_data[yes_field] = "Yes" if is_yes else "Off"
-                    pdf_form_data[no_field] = "Yes" if not is_yes else "Off"
-        
-        # Add the signature date to the form
-        if "signatureDate" in FIELD_MAPPING:
-            pdf_form_data[FIELD_MAPPING["signatureDate"]] = signature_date
-        
-        # Process form data
-        try:
-            # Fill the PDF form
-            fillpdfs.write_fillable_pdf(
-                TEMPLATE_PDF_PATH,
-                temp_filled_pdf_path,
-                pdf_form_data,
-                flatten=False  # Keep form fields active
-            )
-            
-            # Add signature date and hash to Text_41 if available
-            if signature_date or signature_hash:
-                text = ""
-                if signature_date:
-                    text += f"Signed: {signature_date}"
-                if signature_hash:
-                    if text:
-                        text += " | "
-                    text += f"Hash: {signature_hash}"
-                
-                pdf_form_data['Text_41'] = text
-                fillpdfs.write_fillable_pdf(
-                    temp_filled_pdf_path,
-                    temp_filled_pdf_path,
-                    {'Text_41': text},
-                    flatten=False
-                )
+        if not is_batch:
+            output_buf, error = _process_one(request_json[0]['body'], available_fields, template_reader)
+            if error:
+                return error
             
-            # Add signature to the PDF using our custom method
-            add_signature_to_pdf(
-                temp_filled_pdf_path,
-                output_pdf_path,
-                temp_signature_path,
-                signature_hash,
-                signature_date
+            # Stream the final PDF straight from the in-memory buffer
+            return flask.send_file(
+                output_buf,
+                mimetype='application/pdf',
+                as_attachment=True,
+                download_name=OUTPUT_PDF_FILENAME
             )
-            print("Signature added to PDF")
-        except Exception as e:
-            return f"Error filling PDF form: {e}", 500
-            
-        # Return the final PDF
-        try:
-            with open(output_pdf_path, "rb") as f:
-                pdf_bytes = f.read()
-
-            # Clean up temporary files
-            for temp_file in [temp_signature_path, temp_filled_pdf_path, output_pdf_path]:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-
-            return pdf_bytes, 200, {
-                'Content-Type': 'application/pdf', 
-                'Content-Disposition': f'attachment; filename={OUTPUT_PDF_FILENAME}'
+        
+        # Fill all forms concurrently against the one cached template, and write each PDF
+        # into the zip (uncompressed, they are already compressed) as soon as it is done
+        # so only the zip plus the PDFs in flight are held in memory
+        zip_buf = io.BytesIO()
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor, \
+                zipfile.ZipFile(zip_buf, 'w', zipfile.ZIP_STORED) as zip_file:
+            futures = {
+                executor.submit(_process_one, data['body'], available_fields, template_reader): index
+                for index, data in enumerate(request_json, start=1)
             }
-        except Exception as e:
-            # Clean up temporary files in case of error
-            for temp_file in [temp_signature_path, temp_filled_pdf_path, output_pdf_path]:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            return f"Error reading final PDF: {e}", 500
+            for future in as_completed(futures):
+                index = futures.pop(future)
+                output_buf, error = future.result()
+                if error:
+                    executor.shutdown(cancel_futures=True)
+                    message, status = error
+                    return f"Item {index}: {message}", status
+                zip_file.writestr(OUTPUT_PDF_FILENAME.replace('.pdf', f'_{index}.pdf'), output_buf.getbuffer())
+        zip_buf.seek(0)
+        
+        return flask.send_file(
+            zip_buf,
+            mimetype='application/zip',
+            as_attachment=True,
+            download_name=BATCH_OUTPUT_FILENAME
+        )
             
     except Exception as e:
         # General error handling
-        # Clean up any temp files if they exist
-        for temp_file in ['temp_signature_path', 'temp_filled_pdf_path', 'output_pdf_path']:
-            if temp_file in locals() and os.path.exists(locals()[temp_file]):
-                os.remove(locals()[temp_file])
         return f"An unexpected error occurred: {e}", 500 
\ No newline at end of file